@@ -6,18 +6,25 @@ Exposes metrics at /metrics endpoint for Prometheus scraping.
 """
 
 import os
+import json
 import random
 import time
 import logging
-from flask import Flask, Response, jsonify, request
+import threading
+import numpy as np
+from flask import Flask, Response, jsonify
 from prometheus_client import (
     Gauge, 
     Counter, 
     Histogram,
     generate_latest, 
     CollectorRegistry,
-    CONTENT_TYPE_LATEST
+    REGISTRY,
+    CONTENT_TYPE_LATEST,
+    multiprocess
 )
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import HTTP_STATUS_CODES
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from prometheus_client import make_wsgi_app
 
@@ -35,8 +42,24 @@ app = Flask(__name__)
 APP_NAME = os.environ.get('APP_NAME', 'webapp')
 FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
 
+# Pre-serialized JSON bodies for the hot endpoints
+_APP_NAME_JSON = json.dumps(APP_NAME).encode()
+_INDEX_BODY_TEMPLATE = (
+    b'{"app":' + _APP_NAME_JSON +
+    b',"load_factor":%.2f,"response_time":%.3f,"status":"ok"}\n'
+)
+_HEALTH_BODY = json.dumps({'app': APP_NAME, 'status': 'healthy'}, separators=(',', ':')).encode() + b'\n'
+_READY_BODY = json.dumps({'app': APP_NAME, 'status': 'ready'}, separators=(',', ':')).encode() + b'\n'
+
 # Create Prometheus metrics registry
-registry = CollectorRegistry()
+# Under multi-worker Gunicorn, metrics are written to memory-mapped files in
+# PROMETHEUS_MULTIPROC_DIR and /metrics aggregates all workers through a
+# MultiProcessCollector. Metrics themselves live in the default registry.
+if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+else:
+    registry = REGISTRY
 
 # Define Prometheus metrics
 
@@ -44,22 +67,21 @@ registry = CollectorRegistry()
 response_time_gauge = Gauge(
     'webapp_response_time_seconds',
     'Simulated response time in seconds',
-    registry=registry
+    multiprocess_mode='livemostrecent'
 )
 
 # Gauge: Current request count (simulated load indicator)
 request_count_gauge = Gauge(
     'webapp_request_count',
     'Simulated request count',
-    registry=registry
+    multiprocess_mode='livemostrecent'
 )
 
 # Counter: Total requests processed
 total_requests = Counter(
     'webapp_total_requests',
     'Total number of requests processed',
-    ['method', 'endpoint', 'status'],
-    registry=registry
+    ['method', 'endpoint', 'status']
 )
 
 # Histogram: Request duration distribution
@@ -67,7 +89,6 @@ request_duration = Histogram(
     'webapp_request_duration_seconds',
     'Request duration in seconds',
     ['method', 'endpoint'],
-    registry=registry,
     buckets=(0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
 )
 
@@ -76,7 +97,7 @@ app_info = Gauge(
     'webapp_info',
     'Application information',
     ['app_name', 'version', 'environment'],
-    registry=registry
+    multiprocess_mode='max'
 )
 
 # Set application info
@@ -90,20 +111,100 @@ app_info.labels(
 health_status = Gauge(
     'webapp_health_status',
     'Application health status (1=healthy, 0=unhealthy)',
-    registry=registry
+    multiprocess_mode='livemin'
 )
 health_status.set(1)
 
+# Label-bound metric children, cached per label tuple so the metrics
+# middleware skips the labels() lookup after the first request for each combination
+_dur_cache = {}
+_cnt_cache = {}
+
+# Status label strings for common status lines (e.g. '200 OK' -> '200')
+_STATUS_STR = {
+    f'{code} {HTTP_STATUS_CODES[code].upper()}': str(code)
+    for code in (200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 500, 502, 503, 504)
+}
+
+# Serialized /metrics payload, reused for repeated scrapes within the TTL
+METRICS_CACHE_TTL = float(os.environ.get('METRICS_CACHE_TTL', '1.0'))
+_metrics_cache = (float('-inf'), b'')
+_metrics_lock = threading.Lock()
+
+
+def _log_spike(spike_factor):
+    """
+    Log a simulated load spike (rare path, kept out of the response time model).
+    """
+    logger.info("Simulating load spike: %sx normal", spike_factor)
+
+
+# Number of pre-generated uniform samples held by the load simulator
+RANDOM_BUFFER_SIZE = 65536
+
+
+def _compute_response_time(base, load_factor, spike_probability, r0, r1, r2, r3):
+    """
+    Response time model.
+    
+    Takes four uniform samples in [0, 1) and applies the random variation,
+    spike and jitter terms described in LoadSimulator.
+    """
+    # Random variation around base time: uniform(0.8, 1.2)
+    random_factor = 0.8 + 0.4 * r0
+    
+    # Occasional spikes: uniform(2.0, 5.0) with spike_probability, computed
+    # branchless as 1.0 + mask * (factor - 1.0)
+    spike_factor = 1.0 + (r1 < spike_probability) * (1.0 + 3.0 * r2)
+    
+    # Jitter: uniform(-0.02, 0.02)
+    jitter = -0.02 + 0.04 * r3
+    
+    return max(0.01, base * random_factor * load_factor * spike_factor + jitter)
+
+
+def _compute_request_count(load_factor, r0):
+    """
+    Request count model: 50 * uniform(0.5, 1.5) * load_factor.
+    """
+    return int(50 * (0.5 + r0) * load_factor)
+
 
 class LoadSimulator:
     """
     Simulates variable load patterns for realistic testing.
+    
+    Random noise is drawn from a pre-generated buffer of uniform samples in
+    [0, 1), generated by NumPy in bulk and converted to a list once per
+    refill, rather than calling the random module per value.
     """
     def __init__(self):
         self.base_response_time = 0.1
         self.load_factor = 1.0
         self.spike_probability = 0.05
         
+        # Pre-generated uniform samples as plain floats, refilled when exhausted
+        self._rng = np.random.default_rng()
+        self._rand = self._rng.random(RANDOM_BUFFER_SIZE).tolist()
+        self._idx = 0
+    
+    def _reserve(self, count):
+        """
+        Reserve the next `count` uniform samples in the buffer.
+        
+        Args:
+            count: Number of samples to reserve
+            
+        Returns:
+            Index of the first reserved sample in self._rand
+        """
+        i = self._idx
+        if i + count > RANDOM_BUFFER_SIZE:
+            self._rand = self._rng.random(RANDOM_BUFFER_SIZE).tolist()
+            i = 0
+        self._idx = i + count
+        return i
+        
     def get_simulated_response_time(self):
         """
         Generate simulated response time with realistic patterns.
@@ -112,27 +213,20 @@ class LoadSimulator:
         - Occasional spikes to simulate high load
         - Gradual trend changes
         """
-        # Random variation around base time
-        random_factor = random.uniform(0.8, 1.2)
-        
-        # Occasional spikes (5% probability)
-        if random.random() < self.spike_probability:
-            spike_factor = random.uniform(2.0, 5.0)
-            logger.info(f"Simulating load spike: {spike_factor}x normal")
-        else:
-            spike_factor = 1.0
+        i = self._reserve(4)
+        rand = self._rand
+        r0, r1, r2, r3 = rand[i], rand[i + 1], rand[i + 2], rand[i + 3]
         
-        # Calculate simulated response time
-        response_time = (
-            self.base_response_time * 
-            random_factor * 
-            self.load_factor * 
-            spike_factor
+        response_time = _compute_response_time(
+            self.base_response_time,
+            self.load_factor,
+            self.spike_probability,
+            r0, r1, r2, r3
         )
         
-        # Add some jitter
-        jitter = random.uniform(-0.02, 0.02)
-        response_time = max(0.01, response_time + jitter)
+        # Occasional spikes (5% probability)
+        if r1 < self.spike_probability and logger.isEnabledFor(logging.INFO):
+            _log_spike(2.0 + 3.0 * r2)
         
         return response_time
     
@@ -140,9 +234,7 @@ class LoadSimulator:
         """
         Generate simulated request count.
         """
-        base_count = 50
-        variation = random.uniform(0.5, 1.5)
-        return int(base_count * variation * self.load_factor)
+        return _compute_request_count(self.load_factor, self._rand[self._reserve(1)])
     
     def update_load_factor(self):
         """
@@ -157,37 +249,72 @@ class LoadSimulator:
 load_simulator = LoadSimulator()
 
 
-@app.before_request
-def before_request():
+class MetricsMiddleware:
     """
-    Record request start time for duration tracking.
-    """
-    request.start_time = time.time()
-
-
-@app.after_request
-def after_request(response):
-    """
-    Record metrics after request completes.
+    WSGI middleware recording request duration and request count.
+    
+    Timing brackets the wrapped WSGI application directly, without going
+    through Flask's request hooks. The endpoint label is resolved with the
+    application's URL map so label values stay the Flask endpoint names
+    (requests that do not match a rule are labelled 'unknown').
     """
-    # Calculate request duration
-    if hasattr(request, 'start_time'):
-        duration = time.time() - request.start_time
-        
-        # Record histogram
-        request_duration.labels(
-            method=request.method,
-            endpoint=request.endpoint or 'unknown'
-        ).observe(duration)
+    # Upper bound on cached (method, path) -> endpoint entries
+    ENDPOINT_CACHE_SIZE = 1024
+    
+    def __init__(self, wsgi_app, url_map):
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self._endpoints = {}
     
-    # Increment request counter
-    total_requests.labels(
-        method=request.method,
-        endpoint=request.endpoint or 'unknown',
-        status=response.status_code
-    ).inc()
+    def _endpoint(self, environ):
+        """
+        Resolve the endpoint label for a request.
+        """
+        key = (environ['REQUEST_METHOD'], environ.get('PATH_INFO', ''))
+        endpoint = self._endpoints.get(key)
+        if endpoint is not None:
+            return endpoint
+        
+        # Same matching as Flask: 404, 405 and redirects get no endpoint
+        try:
+            endpoint, _ = self.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return 'unknown'
+        
+        if len(self._endpoints) < self.ENDPOINT_CACHE_SIZE:
+            self._endpoints[key] = endpoint
+        return endpoint
     
-    return response
+    def __call__(self, environ, start_response):
+        start_time = time.perf_counter()
+        status_box = []
+        
+        def _start_response(status, headers, exc_info=None):
+            status_box.append(status)
+            return start_response(status, headers, exc_info)
+        
+        response = self.wsgi_app(environ, _start_response)
+        duration = time.perf_counter() - start_time
+        
+        method = environ['REQUEST_METHOD']
+        endpoint = self._endpoint(environ)
+        
+        # Record histogram
+        key = (method, endpoint)
+        child = _dur_cache.get(key) or _dur_cache.setdefault(key, request_duration.labels(*key))
+        child.observe(duration)
+        
+        # Increment request counter (keyed on the full status line, e.g. '200 OK')
+        if status_box:
+            status = status_box[0]
+            key = (method, endpoint, status)
+            child = _cnt_cache.get(key)
+            if child is None:
+                status_str = _STATUS_STR.get(status) or status[:3]
+                child = _cnt_cache.setdefault(key, total_requests.labels(method, endpoint, status_str))
+            child.inc()
+        
+        return response
 
 
 @app.route('/')
@@ -208,12 +335,10 @@ def index():
     if random.random() < 0.1:
         load_simulator.update_load_factor()
     
-    return jsonify({
-        'status': 'ok',
-        'app': APP_NAME,
-        'response_time': round(simulated_rt, 3),
-        'load_factor': round(load_simulator.load_factor, 2)
-    })
+    return Response(
+        _INDEX_BODY_TEMPLATE % (load_simulator.load_factor, simulated_rt),
+        mimetype='application/json'
+    )
 
 
 @app.route('/health')
@@ -222,10 +347,7 @@ def health():
     Health check endpoint.
     Returns 200 if application is healthy.
     """
-    return jsonify({
-        'status': 'healthy',
-        'app': APP_NAME
-    }), 200
+    return Response(_HEALTH_BODY, status=200, mimetype='application/json')
 
 
 @app.route('/ready')
@@ -234,10 +356,7 @@ def ready():
     Readiness check endpoint.
     Returns 200 if application is ready to serve traffic.
     """
-    return jsonify({
-        'status': 'ready',
-        'app': APP_NAME
-    }), 200
+    return Response(_READY_BODY, status=200, mimetype='application/json')
 
 
 @app.route('/metrics')
@@ -245,9 +364,22 @@ def metrics():
     """
     Prometheus metrics endpoint.
     Returns metrics in Prometheus text format.
+    The serialized output is cached for METRICS_CACHE_TTL seconds.
     """
+    global _metrics_cache
+    
+    now = time.monotonic()
+    ts, body = _metrics_cache
+    if now - ts > METRICS_CACHE_TTL:
+        # Only one request regenerates; others reuse its result
+        with _metrics_lock:
+            ts, body = _metrics_cache
+            if now - ts > METRICS_CACHE_TTL:
+                body = generate_latest(registry)
+                _metrics_cache = (time.monotonic(), body)
+    
     return Response(
-        generate_latest(registry),
+        body,
         mimetype=CONTENT_TYPE_LATEST
     )
 
@@ -299,14 +431,15 @@ def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 
-if __name__ == '__main__':
-    logger.info(f"Starting {APP_NAME} application")
-    logger.info(f"Environment: {FLASK_ENV}")
-    logger.info(f"Metrics endpoint: /metrics")
-    
-    # Run Flask application
-    app.run(
-        host='0.0.0.0',
-        port=8000,
-        debug=(FLASK_ENV == 'development')
-    )
+# Record request metrics around the whole WSGI application
+app.wsgi_app = MetricsMiddleware(app.wsgi_app, app.url_map)
+
+
+# ============================================================================
+# Entry Point
+# ============================================================================
+# The application is served by Gunicorn with gevent workers:
+#
+#     gunicorn -c gunicorn_config.py app:app
+#
+# See gunicorn_config.py for worker sizing and connection settings.
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Gunicorn configuration for the Flask web application.
+
+The simulated workload is I/O bound (the / endpoint sleeps for the simulated
+response time), so gevent workers are used: with time.sleep monkey-patched to
+gevent.sleep, a single worker multiplexes many sleeping requests instead of
+serving one request at a time.
+
+Usage:
+    gunicorn -c gunicorn_config.py app:app
+"""
+
+# Patch the standard library before anything else is imported
+from gevent import monkey
+monkey.patch_all()
+
+import glob
+import math
+import os
+
+
+def _available_cpus():
+    """
+    Number of CPUs this process may actually use.
+    
+    Uses the scheduler affinity mask (respects cpusets) and caps it by the
+    cgroup v2 CPU quota if one is set (e.g. docker-compose `cpus: '0.5'`).
+    """
+    cpus = len(os.sched_getaffinity(0)) or 1
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+# Server socket
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Worker processes
+# The (2 x CPU) + 1 rule sizes sync workers, which block on each request.
+# This app is I/O bound (simulated latency is a sleep), so gevent workers
+# are used instead: one process per available CPU, each multiplexing up to
+# worker_connections concurrent requests.
+workers = int(os.environ.get('GUNICORN_WORKERS', _available_cpus()))
+worker_class = 'gevent'
+worker_connections = 1000
+
+# Recycle workers periodically to bound memory growth
+max_requests = 1000
+max_requests_jitter = 30
+
+# Timeouts
+timeout = 60
+keepalive = 5
+
+# Logging to stdout/stderr
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'
+
+
+# ============================================================================
+# Prometheus multiprocess support
+# ============================================================================
+
+def on_starting(server):
+    """Clear metric files left over from a previous run."""
+    multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(multiproc_dir, '*.db')):
+            os.remove(path)
+
+
+def child_exit(server, worker):
+    """Drop live gauges of a worker that exited."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -8,9 +8,9 @@ of application replicas based on configurable thresholds.
 
 Architecture:
 1. Query Prometheus API for average response time
-2. Determine current replica count via Docker API
+2. Determine current replica count via Docker API (concurrently with 1)
 3. Apply scaling logic based on thresholds
-4. Execute Ansible playbook to scale service
+4. Execute Ansible playbook to scale service (in the background)
 5. Wait for next check interval
 
 Author: Auto-Scaling Simulator
@@ -22,21 +22,31 @@ import sys
 import time
 import logging
 import json
+import signal
 import subprocess
-import requests
+import threading
+import importlib.util
+import numpy as np
+import httpx
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple, Deque
 
 # Configure logging with detailed format
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
+# Scaler records go straight to the handler instead of walking up to root
+logger.addHandler(_log_handler)
+logger.propagate = False
+
+# httpx logs every request at INFO; keep the per-tick output readable
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
 # ============================================================================
 # Configuration from environment variables
 # ============================================================================
@@ -50,6 +60,18 @@ MIN_REPLICAS = int(os.environ.get('MIN_REPLICAS', '1'))
 CHECK_INTERVAL = int(os.environ.get('CHECK_INTERVAL', '10'))
 ANSIBLE_PLAYBOOK = os.environ.get('ANSIBLE_PLAYBOOK', '/ansible/playbook-scale.yml')
 COMPOSE_PROJECT_NAME = os.environ.get('COMPOSE_PROJECT_NAME', 'prometheus-autoscale-sim')
+COMPOSE_FILE = os.environ.get('COMPOSE_FILE', '/docker-compose.yml')
+
+# Docker Engine API over the UNIX socket (DOCKER_HOST=unix:///path/to/docker.sock)
+DOCKER_HOST = os.environ.get('DOCKER_HOST') or 'unix:///var/run/docker.sock'
+if DOCKER_HOST.startswith('unix://'):
+    DOCKER_SOCKET = DOCKER_HOST[len('unix://'):]
+else:
+    DOCKER_SOCKET = '/var/run/docker.sock'
+    logger.warning(
+        f"DOCKER_HOST={DOCKER_HOST} is not a unix:// socket, "
+        f"using {DOCKER_SOCKET} for the Docker API"
+    )
 
 # Scaling cooldown to prevent thrashing (seconds)
 SCALE_UP_COOLDOWN = int(os.environ.get('SCALE_UP_COOLDOWN', '30'))
@@ -60,13 +82,42 @@ SCALE_UP_BREACHES_REQUIRED = int(os.environ.get('SCALE_UP_BREACHES_REQUIRED', '2
 SCALE_DOWN_BREACHES_REQUIRED = int(os.environ.get('SCALE_DOWN_BREACHES_REQUIRED', '3'))
 
 # ============================================================================
-# Global state tracking
+# Prometheus queries
+# ============================================================================
+
+# Scaling metric: average response time over the last 30s
+PROM_LATENCY_QUERY = 'avg_over_time(webapp_response_time_seconds[30s])'
+
+# ============================================================================
+# State tracking
 # ============================================================================
 
-last_scale_time = 0
-last_scale_action = None
 consecutive_threshold_breaches = 0
-scaling_history = []
+
+# Set on SIGTERM to stop the main loop and run the regular shutdown path
+_stop = threading.Event()
+
+
+class ScalingRecord(NamedTuple):
+    """Single entry of the scaling action history."""
+    timestamp: float  # Unix time, see _format_ts()
+    target_replicas: int
+    success: bool
+    duration: float
+
+
+@dataclass(slots=True)
+class ScalerState:
+    """Scaling state of one managed service."""
+    last_scale_time: float = 0.0  # time.monotonic() of the last scaling action
+    last_scale_action: Optional[str] = None
+    # Keep only last 50 scaling actions
+    history: Deque[ScalingRecord] = field(default_factory=lambda: deque(maxlen=50))
+
+
+def _format_ts(ts: float) -> str:
+    """Format a Unix timestamp as local ISO-8601 for display."""
+    return datetime.fromtimestamp(ts).isoformat()
 
 
 # ============================================================================
@@ -89,30 +140,47 @@ class PrometheusClient:
             base_url: Prometheus server URL (e.g., http://prometheus:9090)
         """
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'User-Agent': 'prometheus-autoscaler/1.0'
-        })
+        
+        # Keep-alive connection pool reused for the whole process lifetime.
+        # HTTP/2 is negotiated when Prometheus is served over TLS. A failed
+        # connection attempt is retried once, immediately (further transport
+        # retries back off 0.5s, 1s, ... and would stall wait_for_prometheus).
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=4)
+            ),
+            timeout=5,
+            headers={
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip',
+                'User-Agent': 'prometheus-autoscaler/1.0'
+            }
+        )
         logger.info(f"Initialized Prometheus client: {self.base_url}")
     
-    def query(self, query: str, timeout: int = 5) -> Optional[float]:
+    def close(self):
+        """Close pooled connections to Prometheus."""
+        self.client.close()
+    
+    def _instant_query(self, query: str, timeout: int) -> Optional[List[Dict]]:
         """
-        Execute instant PromQL query and return the result value.
+        Execute instant PromQL query and return the raw result vector.
         
         Args:
             query: PromQL query string
             timeout: Request timeout in seconds
             
         Returns:
-            Float value if successful, None otherwise
+            List of result series if successful, None otherwise
         """
         try:
             url = f"{self.base_url}/api/v1/query"
             params = {'query': query}
             
-            logger.debug(f"Querying Prometheus: {query}")
-            response = self.session.get(url, params=params, timeout=timeout)
+            logger.debug("Querying Prometheus: %s", query)
+            response = self.client.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -124,32 +192,97 @@ class PrometheusClient:
                 logger.error(f"Prometheus query failed: [{error_type}] {error_msg}")
                 return None
             
-            result = data.get('data', {}).get('result', [])
+            return data.get('data', {}).get('result', [])
             
-            if not result:
-                logger.warning(f"No data returned for query: {query}")
-                return None
+        except httpx.TimeoutException:
+            logger.error(f"Prometheus query timed out after {timeout}s")
+            return None
+        except httpx.ConnectError:
+            logger.error(f"Failed to connect to Prometheus at {self.base_url}")
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to query Prometheus: {e}")
+            return None
+        except ValueError as e:
+            logger.error(f"Failed to parse Prometheus response: {e}")
+            return None
+    
+    def query(self, query: str, timeout: int = 5) -> Optional[float]:
+        """
+        Execute instant PromQL query and return the result value.
+        
+        Args:
+            query: PromQL query string
+            timeout: Request timeout in seconds
             
+        Returns:
+            Float value if successful, None otherwise
+        """
+        result = self._instant_query(query, timeout)
+        
+        if result is None:
+            return None
+        
+        if not result:
+            logger.warning(f"No data returned for query: {query}")
+            return None
+        
+        try:
             # Extract value from first result
             # Result format: [{'metric': {...}, 'value': [timestamp, 'value']}]
             value = float(result[0]['value'][1])
-            logger.debug(f"Query result: {value}")
+            logger.debug("Query result: %s", value)
             
             return value
             
-        except requests.exceptions.Timeout:
-            logger.error(f"Prometheus query timed out after {timeout}s")
-            return None
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Failed to connect to Prometheus at {self.base_url}")
-            return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to query Prometheus: {e}")
-            return None
         except (KeyError, IndexError, ValueError) as e:
             logger.error(f"Failed to parse Prometheus response: {e}")
             return None
     
+    def query_batch(self, queries: List[str], timeout: int = 5) -> List[Optional[float]]:
+        """
+        Execute several instant PromQL queries in a single HTTP round-trip.
+        
+        Each expression is tagged with a `query_id` label via label_replace()
+        and the tagged vectors are combined with `or`, so the response can
+        be split back per query. Expressions must return instant vectors
+        (e.g. avg(...)), not scalars.
+        
+        Args:
+            queries: PromQL query strings
+            timeout: Request timeout in seconds
+            
+        Returns:
+            List of float values (None where no data), in the order of queries
+        """
+        values: List[Optional[float]] = [None] * len(queries)
+        if not queries:
+            return values
+        
+        combined = ' or '.join(
+            f'label_replace({q}, "query_id", "{i}", "", "")'
+            for i, q in enumerate(queries)
+        )
+        
+        result = self._instant_query(combined, timeout)
+        if not result:
+            return values
+        
+        try:
+            for series in result:
+                i = int(series['metric']['query_id'])
+                if values[i] is None:
+                    values[i] = float(series['value'][1])
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"Failed to parse Prometheus batch response: {e}")
+            return [None] * len(queries)
+        
+        for q, value in zip(queries, values):
+            if value is None:
+                logger.warning(f"No data returned for query: {q}")
+        
+        return values
+    
     def query_range(self, query: str, start: int, end: int, step: str = '15s') -> Optional[List[Dict]]:
         """
         Execute range PromQL query and return time-series data.
@@ -172,7 +305,7 @@ class PrometheusClient:
                 'step': step
             }
             
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.client.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -183,7 +316,7 @@ class PrometheusClient:
             
             return data.get('data', {}).get('result', [])
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to execute range query: {e}")
             return None
     
@@ -196,7 +329,7 @@ class PrometheusClient:
         """
         try:
             url = f"{self.base_url}/-/healthy"
-            response = self.session.get(url, timeout=5)
+            response = self.client.get(url, timeout=5)
             is_healthy = response.status_code == 200
             
             if is_healthy:
@@ -206,7 +339,7 @@ class PrometheusClient:
             
             return is_healthy
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Prometheus health check failed: {e}")
             return False
     
@@ -219,7 +352,7 @@ class PrometheusClient:
         """
         try:
             url = f"{self.base_url}/api/v1/targets"
-            response = self.session.get(url, timeout=5)
+            response = self.client.get(url, timeout=5)
             response.raise_for_status()
             
             data = response.json()
@@ -229,7 +362,7 @@ class PrometheusClient:
             
             return None
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get targets: {e}")
             return None
 
@@ -255,8 +388,49 @@ class DockerManager:
         """
         self.service_name = service_name
         self.project_name = project_name
+        
+        # Persistent connection to the Docker Engine API over the UNIX socket
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(uds=DOCKER_SOCKET),
+            base_url='http://docker',
+            timeout=5
+        )
+        self.container_filters = json.dumps({
+            'name': [f'{project_name}_{service_name}'],
+            'status': ['running']
+        })
+        
+        # Environment for docker-compose, as set by the Ansible playbook
+        self.compose_env = {**os.environ, 'COMPOSE_HTTP_TIMEOUT': '120'}
         logger.info(f"Initialized Docker manager for service: {service_name}")
     
+    def close(self):
+        """Close the connection to the Docker Engine API."""
+        self.client.close()
+    
+    def _list_containers(self) -> List[Dict[str, Any]]:
+        """
+        List running containers of the service via the Docker Engine API.
+        
+        Returns:
+            List of container descriptions (raises on API errors)
+        """
+        response = self.client.get(
+            '/containers/json',
+            params={'filters': self.container_filters}
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    def count_replicas(self) -> int:
+        """
+        Count running replicas of the service, without a fallback value.
+        
+        Returns:
+            Number of running replicas (raises on API errors)
+        """
+        return len(self._list_containers())
+    
     def get_current_replicas(self) -> int:
         """
         Get current number of running replicas for the service.
@@ -265,35 +439,18 @@ class DockerManager:
             Number of running replicas
         """
         try:
-            # Use docker ps to count containers for this service
-            cmd = [
-                'docker', 'ps',
-                '--filter', f'name={self.project_name}_{self.service_name}',
-                '--filter', 'status=running',
-                '--format', '{{.Names}}'
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
+            containers = self._list_containers()
+            count = len(containers)
             
-            # Count lines (each line is one container)
-            container_names = [line for line in result.stdout.strip().split('\n') if line]
-            count = len(container_names)
-            
-            logger.debug(f"Found {count} running replicas: {container_names}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found %d running replicas: %s", count, [c['Names'] for c in containers])
             return count
             
-        except subprocess.TimeoutExpired:
-            logger.error("Docker command timed out")
+        except httpx.TimeoutException:
+            logger.error("Docker API request timed out")
             return MIN_REPLICAS
-        except subprocess.CalledProcessError as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get replica count: {e}")
-            logger.error(f"Stderr: {e.stderr}")
             return MIN_REPLICAS
         except Exception as e:
             logger.error(f"Unexpected error getting replica count: {e}")
@@ -307,34 +464,43 @@ class DockerManager:
             List of container statistics
         """
         try:
-            cmd = [
-                'docker', 'stats',
-                '--no-stream',
-                '--format', '{{json .}}',
-                f'{self.project_name}_{self.service_name}'
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
-            
             stats = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    try:
-                        stats.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+            for container in self._list_containers():
+                response = self.client.get(
+                    f"/containers/{container['Id']}/stats",
+                    params={'stream': 'false'},
+                    timeout=10
+                )
+                response.raise_for_status()
+                stats.append(response.json())
             
             return stats
             
         except Exception as e:
             logger.error(f"Failed to get container stats: {e}")
             return []
+    
+    def scale_command(self, target_replicas: int) -> List[str]:
+        """
+        Build the docker-compose command that scales the service.
+        
+        Same compose invocation as the Ansible playbook.
+        
+        Args:
+            target_replicas: Desired number of replicas
+            
+        Returns:
+            docker-compose argument list
+        """
+        return [
+            'docker-compose',
+            '-f', COMPOSE_FILE,
+            '-p', self.project_name,
+            'up', '-d',
+            '--scale', f'{self.service_name}={target_replicas}',
+            '--no-recreate',
+            '--remove-orphans'
+        ]
 
 
 # ============================================================================
@@ -349,11 +515,31 @@ class ScalingDecisionEngine:
     observed metrics, thresholds, and historical patterns.
     """
     
+    # Keep only last 100 samples (about 16 minutes at 10s intervals)
+    HISTORY_SIZE = 100
+    
     def __init__(self):
         """Initialize decision engine."""
-        self.history = []
+        # Sample history as parallel circular arrays
+        self._metric = np.empty(self.HISTORY_SIZE, dtype=np.float64)
+        self._replicas = np.empty(self.HISTORY_SIZE, dtype=np.int32)
+        self._n = 0
+        self._head = 0
+        
+        # Total samples ever recorded; keys the statistics cache
+        self._samples_seen = 0
+        self._stats_cache: Optional[tuple] = None
+        
+        # Exponential moving average of the metric (alpha=0.3, ~5-sample window)
+        self._ema: float = 0.0
+        self._ema_init = False
         logger.info("Initialized scaling decision engine")
     
+    def reset_breaches(self):
+        """Reset the consecutive threshold breach streak."""
+        global consecutive_threshold_breaches
+        consecutive_threshold_breaches = 0
+    
     def decide_scale(
         self,
         current_metric: Optional[float],
@@ -381,27 +567,22 @@ class ScalingDecisionEngine:
         
         if current_metric is None:
             logger.warning("No metric data available, cannot make scaling decision")
-            consecutive_threshold_breaches = 0
+            self.reset_breaches()
             return None
         
         # Store in history for trend analysis
-        self.history.append({
-            'timestamp': datetime.now().isoformat(),
-            'metric': current_metric,
-            'replicas': current_replicas,
-            'threshold_up': threshold_up,
-            'threshold_down': threshold_down
-        })
-        
-        # Keep only last 100 entries (about 16 minutes at 10s intervals)
-        if len(self.history) > 100:
-            self.history.pop(0)
+        self._metric[self._head] = current_metric
+        self._replicas[self._head] = current_replicas
+        self._head = (self._head + 1) % self.HISTORY_SIZE
+        if self._n < self.HISTORY_SIZE:
+            self._n += 1
+        self._samples_seen += 1
         
         # Calculate metric statistics for better decision making
-        recent_metrics = [h['metric'] for h in self.history[-5:]]
-        avg_recent = sum(recent_metrics) / len(recent_metrics) if recent_metrics else current_metric
+        self._ema = 0.3 * current_metric + 0.7 * self._ema if self._ema_init else current_metric
+        self._ema_init = True
         
-        logger.debug(f"Metric analysis - Current: {current_metric:.3f}, Recent avg: {avg_recent:.3f}")
+        logger.debug("Metric analysis - Current: %.3f, Recent avg: %.3f", current_metric, self._ema)
         
         # ====================================================================
         # Scale Up Logic
@@ -474,8 +655,8 @@ class ScalingDecisionEngine:
         else:
             if consecutive_threshold_breaches > 0:
                 logger.debug(
-                    f"Metric back within acceptable range "
-                    f"({threshold_down}s - {threshold_up}s), resetting breach counter"
+                    "Metric back within acceptable range (%ss - %ss), resetting breach counter",
+                    threshold_down, threshold_up
                 )
             consecutive_threshold_breaches = 0
             return None
@@ -486,24 +667,32 @@ class ScalingDecisionEngine:
         """
         Get statistics about scaling history and patterns.
         
+        The result is cached until the next sample is recorded.
+        
         Returns:
             Dictionary containing scaling statistics
         """
-        if not self.history:
+        if not self._n:
             return {}
         
-        metrics = [h['metric'] for h in self.history]
-        replicas = [h['replicas'] for h in self.history]
-        
-        return {
-            'total_samples': len(self.history),
-            'avg_metric': sum(metrics) / len(metrics),
-            'min_metric': min(metrics),
-            'max_metric': max(metrics),
-            'avg_replicas': sum(replicas) / len(replicas),
-            'min_replicas': min(replicas),
-            'max_replicas': max(replicas)
+        cache = self._stats_cache
+        if cache is not None and cache[0] == self._samples_seen:
+            return cache[1]
+        
+        metrics = self._metric[:self._n]
+        replicas = self._replicas[:self._n]
+        
+        stats = {
+            'total_samples': self._n,
+            'avg_metric': float(metrics.mean()),
+            'min_metric': float(metrics.min()),
+            'max_metric': float(metrics.max()),
+            'avg_replicas': float(replicas.mean()),
+            'min_replicas': int(replicas.min()),
+            'max_replicas': int(replicas.max())
         }
+        self._stats_cache = (self._samples_seen, stats)
+        return stats
 
 
 # ============================================================================
@@ -515,54 +704,252 @@ class AnsibleExecutor:
     Executor for running Ansible playbooks.
     
     Provides interface to trigger infrastructure changes via Ansible.
+    Playbooks can run on a dedicated worker thread so the monitoring loop
+    keeps sampling while a scaling action is in progress.
+    
+    Plain replica changes within MIN_REPLICAS..MAX_REPLICAS go straight to
+    docker-compose when a Docker manager is given, and the resulting replica
+    count is verified; the playbook (with its own limit checks and
+    verification) is the fallback.
     """
     
-    def __init__(self, playbook_path: str):
+    def __init__(
+        self,
+        playbook_path: str,
+        state: ScalerState,
+        docker_manager: Optional[DockerManager] = None
+    ):
         """
         Initialize Ansible executor.
         
         Args:
             playbook_path: Path to Ansible playbook file
+            state: Scaler state that receives the scaling history
+            docker_manager: Docker manager used to scale without Ansible
         """
-        self.playbook_path = playbook_path
-        logger.info(f"Initialized Ansible executor: {playbook_path}")
+        self.state = state
+        self.docker_manager = docker_manager
         
-        # Verify playbook exists
-        if not os.path.exists(playbook_path):
-            logger.error(f"Playbook not found: {playbook_path}")
+        # Resolve once so every run gets the same canonical path
+        self.playbook_path = os.path.realpath(playbook_path)
+        
+        # Static part of the ansible-playbook command line
+        self._cmd_prefix = ['ansible-playbook', self.playbook_path]
+        self._verbose_suffix = ['-v']
+        
+        # Single worker: at most one playbook runs at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ansible')
+        
+        # In-flight command (playbook or docker-compose) for shutdown();
+        # the lock keeps shutdown() from missing a command that is starting
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._stopping = False
+        
+        # time.monotonic() when the last scaling action finished
+        self.last_finished: Optional[float] = None
+        
+        # Environment for ansible-playbook: pipelining and persistent SSH
+        # connections, plus the Mitogen strategy when ansible-mitogen is installed
+        self._env = {
+            **os.environ,
+            'ANSIBLE_PIPELINING': 'True',
+            'ANSIBLE_SSH_ARGS': '-C -o ControlMaster=auto -o ControlPersist=120s'
+        }
+        mitogen = importlib.util.find_spec('ansible_mitogen')
+        if mitogen is not None and mitogen.submodule_search_locations:
+            self._env['ANSIBLE_STRATEGY_PLUGINS'] = os.path.join(
+                mitogen.submodule_search_locations[0], 'plugins', 'strategy'
+            )
+            self._env['ANSIBLE_STRATEGY'] = 'mitogen_linear'
+        else:
+            self._env['ANSIBLE_STRATEGY'] = 'linear'
+        
+        logger.info(
+            f"Initialized Ansible executor: {self.playbook_path} "
+            f"(strategy: {self._env['ANSIBLE_STRATEGY']})"
+        )
+        
+        # Verify playbook exists (single stat; scale_service() skips the
+        # playbook when it was missing at startup)
+        try:
+            self.playbook_mtime: Optional[float] = os.stat(self.playbook_path).st_mtime
+        except OSError:
+            self.playbook_mtime = None
+            logger.error(f"Playbook not found: {self.playbook_path}")
     
-    def scale_service(self, target_replicas: int) -> bool:
+    def scale_service_async(self, target_replicas: int) -> Future:
         """
-        Execute Ansible playbook to scale service.
+        Execute Ansible playbook to scale service without blocking.
         
         Args:
             target_replicas: Desired number of replicas
             
         Returns:
-            True if successful, False otherwise
+            Future resolving to the result of scale_service()
+        """
+        return self._executor.submit(self.scale_service, target_replicas)
+    
+    def shutdown(self):
+        """
+        Stop the in-flight scaling command, if any, and the worker thread.
+        """
+        with self._lock:
+            self._stopping = True
+            process = self._process
+        if process is not None and process.poll() is None:
+            logger.warning("Terminating in-flight scaling command")
+            self._signal_group(process, signal.SIGTERM)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    @staticmethod
+    def _signal_group(process: subprocess.Popen, sig: int):
+        """
+        Send a signal to a process started in its own session and its children.
+        
+        Args:
+            process: Process started with start_new_session=True
+            sig: Signal to send
         """
         try:
-            cmd = [
-                'ansible-playbook',
-                self.playbook_path,
-                '-e', f'target_replicas={target_replicas}',
-                '-v'  # Verbose output
-            ]
-            
-            logger.info(f"Executing: {' '.join(cmd)}")
-            start_time = time.time()
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+    
+    def _run(self, cmd: List[str], env: Dict[str, str], capture_stdout: bool, timeout: int = 120):
+        """
+        Run a command in its own session, stoppable by shutdown().
+        
+        Args:
+            cmd: Command to execute
+            env: Environment for the command
+            capture_stdout: Whether to capture stdout (discarded otherwise)
+            timeout: Maximum run time in seconds
             
-            result = subprocess.run(
+        Returns:
+            Tuple of captured (stdout, stderr)
+            
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero
+            subprocess.TimeoutExpired: If the command runs too long
+            subprocess.SubprocessError: If the executor is shutting down
+        """
+        with self._lock:
+            if self._stopping:
+                raise subprocess.SubprocessError("Executor is shutting down")
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=True,
-                timeout=120  # 2 minute timeout
+                env=env,
+                start_new_session=True
             )
+            self._process = process
+        
+        with process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self._signal_group(process, signal.SIGKILL)
+                process.communicate()
+                raise
+            finally:
+                self._process = None
+        
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+        return stdout, stderr
+    
+    def _scale_direct(self, target_replicas: int) -> bool:
+        """
+        Scale with docker-compose directly and verify the replica count.
+        
+        Args:
+            target_replicas: Desired number of replicas
+            
+        Returns:
+            True if the service runs target_replicas replicas afterwards,
+            False if the playbook should be used instead
+        """
+        start_time = time.time()
+        try:
+            self._run(
+                self.docker_manager.scale_command(target_replicas),
+                self.docker_manager.compose_env,
+                capture_stdout=False
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            if self._stopping:
+                logger.warning("docker-compose scaling interrupted by shutdown")
+            else:
+                logger.warning(f"Direct docker-compose scaling failed ({e}), falling back to Ansible")
+            return False
+        
+        # get_current_replicas() would report MIN_REPLICAS on API errors
+        try:
+            running = self.docker_manager.count_replicas()
+        except Exception as e:
+            logger.warning(f"Could not verify docker-compose scaling ({e}), falling back to Ansible")
+            return False
+        
+        if running != target_replicas:
+            logger.warning(
+                f"docker-compose left {running}/{target_replicas} replicas running, "
+                f"falling back to Ansible"
+            )
+            return False
+        
+        duration = time.time() - start_time
+        logger.info(f"Scaled with docker-compose in {duration:.2f}s")
+        self._record_scaling_action(target_replicas, True, duration)
+        return True
+    
+    def scale_service(self, target_replicas: int) -> bool:
+        """
+        Scale service, directly via docker-compose if possible, else with Ansible.
+        
+        Args:
+            target_replicas: Desired number of replicas
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if (
+            self.docker_manager is not None
+            and MIN_REPLICAS <= target_replicas <= MAX_REPLICAS
+            and self._scale_direct(target_replicas)
+        ):
+            return True
+        
+        if self._stopping:
+            self._record_scaling_action(target_replicas, False, 0)
+            return False
+        
+        if self.playbook_mtime is None:
+            logger.error(f"Cannot scale with Ansible, playbook not found: {self.playbook_path}")
+            self._record_scaling_action(target_replicas, False, 0)
+            return False
+        
+        try:
+            # Verbose playbook output is only generated and captured when debugging;
+            # failed task details go to stderr (display_failed_stderr)
+            debug = logger.isEnabledFor(logging.DEBUG)
+            
+            cmd = self._cmd_prefix + ['-e', f'target_replicas={target_replicas}']
+            if debug:
+                cmd += self._verbose_suffix  # Verbose output
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Executing: %s", ' '.join(cmd))
+            start_time = time.time()
+            
+            stdout, stderr = self._run(cmd, self._env, capture_stdout=debug)  # 2 minute timeout
             
             duration = time.time() - start_time
             logger.info(f"Ansible playbook executed successfully in {duration:.2f}s")
-            logger.debug(f"Output: {result.stdout}")
+            if debug:
+                logger.debug("Output: %s", stdout)
             
             # Record successful scaling action
             self._record_scaling_action(target_replicas, True, duration)
@@ -575,7 +962,8 @@ class AnsibleExecutor:
             return False
         except subprocess.CalledProcessError as e:
             logger.error(f"Ansible playbook failed with exit code {e.returncode}")
-            logger.error(f"Stdout: {e.stdout}")
+            if e.stdout:
+                logger.error(f"Stdout: {e.stdout}")
             logger.error(f"Stderr: {e.stderr}")
             self._record_scaling_action(target_replicas, False, 0)
             return False
@@ -593,45 +981,42 @@ class AnsibleExecutor:
             success: Whether the action was successful
             duration: Execution duration in seconds
         """
-        global scaling_history
-        
-        scaling_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'target_replicas': target,
-            'success': success,
-            'duration': duration
-        })
-        
-        # Keep only last 50 scaling actions
-        if len(scaling_history) > 50:
-            scaling_history.pop(0)
+        # Set before the future resolves, so the cooldown starts at completion
+        self.last_finished = time.monotonic()
+        self.state.history.append(ScalingRecord(
+            timestamp=time.time(),
+            target_replicas=target,
+            success=success,
+            duration=duration
+        ))
 
 
 # ============================================================================
 # Cooldown Management
 # ============================================================================
 
-def check_cooldown(action: str) -> bool:
+def check_cooldown(state: ScalerState, action: str) -> bool:
     """
     Check if enough time has passed since last scaling action.
     
     Prevents rapid scaling changes (thrashing) by enforcing cooldown periods.
     
     Args:
+        state: Scaler state of the service
         action: 'up' or 'down'
         
     Returns:
         True if cooldown period has passed, False otherwise
     """
-    global last_scale_time, last_scale_action
-    
-    current_time = time.time()
-    time_since_last_scale = current_time - last_scale_time
+    last_scale_action = state.last_scale_action
     
     # No previous scaling action
     if last_scale_action is None:
         return True
     
+    # Monotonic clock: wall-clock adjustments must not shorten or extend cooldowns
+    time_since_last_scale = time.monotonic() - state.last_scale_time
+    
     # Determine required cooldown based on action type
     if action == 'up':
         required_cooldown = SCALE_UP_COOLDOWN
@@ -640,34 +1025,65 @@ def check_cooldown(action: str) -> bool:
     
     # Check if cooldown period has passed
     if time_since_last_scale < required_cooldown:
-        remaining = int(required_cooldown - time_since_last_scale)
-        logger.info(
-            f"Cooldown active: {remaining}s remaining for {action} action "
-            f"(last action: {last_scale_action}, {int(time_since_last_scale)}s ago)"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            remaining = int(required_cooldown - time_since_last_scale)
+            logger.info(
+                f"Cooldown active: {remaining}s remaining for {action} action "
+                f"(last action: {last_scale_action}, {int(time_since_last_scale)}s ago)"
+            )
         return False
     
-    logger.debug(f"Cooldown check passed for {action} action")
+    logger.debug("Cooldown check passed for %s action", action)
     return True
 
 
-def update_scale_state(action: str):
+def update_scale_state(state: ScalerState, action: str, finished_at: Optional[float] = None):
     """
     Update scaling state after successful action.
     
     Args:
+        state: Scaler state of the service
         action: 'up' or 'down'
+        finished_at: time.monotonic() when the action finished (default: now)
     """
-    global last_scale_time, last_scale_action
-    last_scale_time = time.time()
-    last_scale_action = action
-    logger.debug(f"Updated scale state: action={action}, time={last_scale_time}")
+    state.last_scale_time = time.monotonic() if finished_at is None else finished_at
+    state.last_scale_action = action
+    logger.debug("Updated scale state: action=%s, time=%s", action, state.last_scale_time)
 
 
 # ============================================================================
 # Main Application
 # ============================================================================
 
+# Log separators
+_SEP60 = "=" * 60
+_RULE60 = "─" * 60
+
+# Scaling decision block: action, current, target, change
+_SCALE_BANNER = (
+    "\n" + _RULE60 + "\n"
+    "🔧 SCALING ACTION REQUIRED\n"
+    + _RULE60 + "\n"
+    "  Direction: %s\n"
+    "  Current:   %d replicas\n"
+    "  Target:    %d replicas\n"
+    "  Change:    %+d replicas"
+)
+
+# Periodic statistics block, formatted from the get_scaling_statistics() dict
+_STATS_BLOCK = (
+    "\n" + _RULE60 + "\n"
+    "📊 STATISTICS (last %(total_samples)d samples)\n"
+    + _RULE60 + "\n"
+    "  Avg Response Time: %(avg_metric).3fs\n"
+    "  Min Response Time: %(min_metric).3fs\n"
+    "  Max Response Time: %(max_metric).3fs\n"
+    "  Avg Replicas:      %(avg_replicas).1f\n"
+    "  Replica Range:     %(min_replicas)d - %(max_replicas)d\n"
+    + _RULE60 + "\n"
+)
+
+
 def print_startup_banner():
     """Print startup banner with configuration details."""
     banner = """
@@ -676,41 +1092,57 @@ def print_startup_banner():
     ║     Version 1.0.0                                          ║
     ╚════════════════════════════════════════════════════════════╝
     """
-    logger.info(banner)
-    logger.info("=" * 60)
-    logger.info("Configuration:")
-    logger.info("=" * 60)
-    logger.info(f"  Prometheus URL:        {PROMETHEUS_URL}")
-    logger.info(f"  Service Name:          {SERVICE_NAME}")
-    logger.info(f"  Scale Up Threshold:    {SCALE_UP_THRESHOLD}s")
-    logger.info(f"  Scale Down Threshold:  {SCALE_DOWN_THRESHOLD}s")
-    logger.info(f"  Replica Range:         {MIN_REPLICAS} - {MAX_REPLICAS}")
-    logger.info(f"  Check Interval:        {CHECK_INTERVAL}s")
-    logger.info(f"  Scale Up Cooldown:     {SCALE_UP_COOLDOWN}s")
-    logger.info(f"  Scale Down Cooldown:   {SCALE_DOWN_COOLDOWN}s")
-    logger.info(f"  Playbook Path:         {ANSIBLE_PLAYBOOK}")
-    logger.info("=" * 60)
-
-
-def wait_for_prometheus(prom_client: PrometheusClient, max_retries: int = 30):
+    # One log record for the whole block
+    lines = [
+        banner,
+        _SEP60,
+        "Configuration:",
+        _SEP60,
+        f"  Prometheus URL:        {PROMETHEUS_URL}",
+        f"  Service Name:          {SERVICE_NAME}",
+        f"  Scale Up Threshold:    {SCALE_UP_THRESHOLD}s",
+        f"  Scale Down Threshold:  {SCALE_DOWN_THRESHOLD}s",
+        f"  Replica Range:         {MIN_REPLICAS} - {MAX_REPLICAS}",
+        f"  Check Interval:        {CHECK_INTERVAL}s",
+        f"  Scale Up Cooldown:     {SCALE_UP_COOLDOWN}s",
+        f"  Scale Down Cooldown:   {SCALE_DOWN_COOLDOWN}s",
+        f"  Playbook Path:         {ANSIBLE_PLAYBOOK}",
+        _SEP60,
+    ]
+    logger.info("\n".join(lines))
+
+
+def wait_for_prometheus(prom_client: PrometheusClient, timeout: float = 150):
     """
     Wait for Prometheus to be ready before starting main loop.
     
+    Retries with exponential backoff (0.25s doubling up to 5s) until the
+    timeout expires.
+    
     Args:
         prom_client: Prometheus client instance
-        max_retries: Maximum number of retry attempts
+        timeout: Maximum time to wait in seconds
     """
     logger.info("Waiting for Prometheus to be ready...")
     
-    for attempt in range(1, max_retries + 1):
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
         if prom_client.health_check():
             logger.info("✓ Prometheus is ready")
             return
         
-        logger.warning(f"Prometheus not ready (attempt {attempt}/{max_retries}), retrying in 5s...")
-        time.sleep(5)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        
+        delay = min(5, 0.25 * 2 ** min(attempt, 5), remaining)
+        attempt += 1
+        logger.warning("Prometheus not ready (attempt %d), retrying in %.2fs...", attempt, delay)
+        if _stop.wait(delay):
+            return
     
-    logger.error(f"Prometheus did not become ready after {max_retries} attempts")
+    logger.error("Prometheus did not become ready after %.0fs (%d attempts)", timeout, attempt + 1)
     sys.exit(1)
 
 
@@ -721,6 +1153,9 @@ def main():
     Continuously monitors Prometheus metrics and triggers scaling actions
     based on configured thresholds and logic.
     """
+    # docker stop / Kubernetes send SIGTERM; shut down like on Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: _stop.set())
+    
     # Print startup information
     print_startup_banner()
     
@@ -728,61 +1163,94 @@ def main():
     prom_client = PrometheusClient(PROMETHEUS_URL)
     docker_manager = DockerManager(SERVICE_NAME, COMPOSE_PROJECT_NAME)
     decision_engine = ScalingDecisionEngine()
-    ansible_executor = AnsibleExecutor(ANSIBLE_PLAYBOOK)
+    state = ScalerState()
+    ansible_executor = AnsibleExecutor(ANSIBLE_PLAYBOOK, state, docker_manager)
     
     # Wait for Prometheus to be ready
     wait_for_prometheus(prom_client)
     
+    # Prometheus and Docker lookups are independent I/O waits, run them in parallel
+    io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scaler-io')
+    
+    # In-flight scaling action: (future, action, target replicas)
+    pending_scale = None
+    
     # Main monitoring loop
     iteration = 0
     
+    # Fixed-rate schedule: iterations start every CHECK_INTERVAL seconds
+    # regardless of how long the work inside an iteration took
+    next_deadline = time.monotonic()
+    
+    # Local aliases for the logging-heavy loop
+    info = logger.info
+    warning = logger.warning
+    error = logger.error
+    
     try:
-        while True:
+        while not _stop.is_set():
             iteration += 1
-            logger.info(f"\n{'=' * 60}")
-            logger.info(f"Iteration #{iteration} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            logger.info('=' * 60)
+            info("\n%s", _SEP60)
+            info("Iteration #%d - %s", iteration, time.strftime('%Y-%m-%d %H:%M:%S'))
+            info(_SEP60)
             
             try:
                 # ============================================================
-                # Step 1: Query Prometheus for metrics
+                # Step 0: Collect result of a finished scaling action
                 # ============================================================
-                query = 'avg_over_time(webapp_response_time_seconds[30s])'
-                avg_response_time = prom_client.query(query)
+                if pending_scale is not None and pending_scale[0].done():
+                    future, action, target = pending_scale
+                    pending_scale = None
+                    
+                    if future.result():
+                        info("✅ Successfully scaled to %d replicas", target)
+                        update_scale_state(state, action, ansible_executor.last_finished)
+                    else:
+                        error("❌ Scaling action failed")
                 
                 # ============================================================
+                # Step 1: Query Prometheus for metrics
                 # Step 2: Get current replica count
                 # ============================================================
-                current_replicas = docker_manager.get_current_replicas()
+                query_future = io_pool.submit(prom_client.query, PROM_LATENCY_QUERY)
+                replicas_future = io_pool.submit(docker_manager.get_current_replicas)
+                
+                avg_response_time = query_future.result()
+                current_replicas = replicas_future.result()
                 
                 # Log current state
-                logger.info(f"Current State:")
+                info("Current State:")
                 if avg_response_time is not None:
-                    logger.info(f"  • Average Response Time (30s): {avg_response_time:.3f}s")
+                    info("  • Average Response Time (30s): %.3fs", avg_response_time)
                     
                     # Visual indicator for thresholds
                     if avg_response_time > SCALE_UP_THRESHOLD:
-                        logger.info(f"    ⚠️  ABOVE scale-up threshold ({SCALE_UP_THRESHOLD}s)")
+                        info("    ⚠️  ABOVE scale-up threshold (%ss)", SCALE_UP_THRESHOLD)
                     elif avg_response_time < SCALE_DOWN_THRESHOLD:
-                        logger.info(f"    ⬇️  BELOW scale-down threshold ({SCALE_DOWN_THRESHOLD}s)")
+                        info("    ⬇️  BELOW scale-down threshold (%ss)", SCALE_DOWN_THRESHOLD)
                     else:
-                        logger.info(f"    ✓ Within acceptable range")
+                        info("    ✓ Within acceptable range")
                 else:
-                    logger.info(f"  • Average Response Time: N/A (no data)")
+                    info("  • Average Response Time: N/A (no data)")
                 
-                logger.info(f"  • Current Replicas: {current_replicas}")
+                info("  • Current Replicas: %d", current_replicas)
                 
                 # ============================================================
                 # Step 3: Make scaling decision
                 # ============================================================
-                target_replicas = decision_engine.decide_scale(
-                    current_metric=avg_response_time,
-                    current_replicas=current_replicas,
-                    threshold_up=SCALE_UP_THRESHOLD,
-                    threshold_down=SCALE_DOWN_THRESHOLD,
-                    min_replicas=MIN_REPLICAS,
-                    max_replicas=MAX_REPLICAS
-                )
+                if avg_response_time is None:
+                    # No data, nothing to decide; a gap breaks the breach streak
+                    decision_engine.reset_breaches()
+                    target_replicas = None
+                else:
+                    target_replicas = decision_engine.decide_scale(
+                        current_metric=avg_response_time,
+                        current_replicas=current_replicas,
+                        threshold_up=SCALE_UP_THRESHOLD,
+                        threshold_down=SCALE_DOWN_THRESHOLD,
+                        min_replicas=MIN_REPLICAS,
+                        max_replicas=MAX_REPLICAS
+                    )
                 
                 # ============================================================
                 # Step 4: Execute scaling if needed
@@ -790,78 +1258,93 @@ def main():
                 if target_replicas is not None and target_replicas != current_replicas:
                     action = 'up' if target_replicas > current_replicas else 'down'
                     
-                    logger.info(f"\n{'─' * 60}")
-                    logger.info(f"🔧 SCALING ACTION REQUIRED")
-                    logger.info(f"{'─' * 60}")
-                    logger.info(f"  Direction: {action.upper()}")
-                    logger.info(f"  Current:   {current_replicas} replicas")
-                    logger.info(f"  Target:    {target_replicas} replicas")
-                    logger.info(f"  Change:    {target_replicas - current_replicas:+d} replicas")
+                    info(
+                        _SCALE_BANNER,
+                        action.upper(),
+                        current_replicas,
+                        target_replicas,
+                        target_replicas - current_replicas
+                    )
                     
-                    # Check cooldown before executing
-                    if not check_cooldown(action):
-                        logger.info("⏸️  Scaling action postponed due to cooldown period")
+                    # Only one scaling action at a time; check cooldown before executing
+                    if pending_scale is not None:
+                        info(
+                            "⏸️  Scaling action postponed, scaling to %d replicas still in progress",
+                            pending_scale[2]
+                        )
+                    elif not check_cooldown(state, action):
+                        info("⏸️  Scaling action postponed due to cooldown period")
                     else:
-                        logger.info(f"▶️  Executing scaling action...")
+                        info("▶️  Executing scaling action...")
                         
-                        if ansible_executor.scale_service(target_replicas):
-                            logger.info(f"✅ Successfully scaled to {target_replicas} replicas")
-                            update_scale_state(action)
-                        else:
-                            logger.error(f"❌ Scaling action failed")
+                        pending_scale = (
+                            ansible_executor.scale_service_async(target_replicas),
+                            action,
+                            target_replicas
+                        )
                     
-                    logger.info(f"{'─' * 60}\n")
+                    info("%s\n", _RULE60)
                 else:
-                    logger.info("✓ No scaling action required")
+                    info("✓ No scaling action required")
                 
                 # ============================================================
                 # Step 5: Print statistics periodically
                 # ============================================================
-                if iteration % 10 == 0:
+                # Only when this iteration fed a new sample to the decision engine
+                if iteration % 10 == 0 and avg_response_time is not None:
                     stats = decision_engine.get_scaling_statistics()
                     if stats:
-                        logger.info(f"\n{'─' * 60}")
-                        logger.info(f"📊 STATISTICS (last {stats['total_samples']} samples)")
-                        logger.info(f"{'─' * 60}")
-                        logger.info(f"  Avg Response Time: {stats['avg_metric']:.3f}s")
-                        logger.info(f"  Min Response Time: {stats['min_metric']:.3f}s")
-                        logger.info(f"  Max Response Time: {stats['max_metric']:.3f}s")
-                        logger.info(f"  Avg Replicas:      {stats['avg_replicas']:.1f}")
-                        logger.info(f"  Replica Range:     {stats['min_replicas']} - {stats['max_replicas']}")
-                        logger.info(f"{'─' * 60}\n")
+                        info(_STATS_BLOCK, stats)
             
             except Exception as e:
-                logger.error(f"Error in iteration {iteration}: {e}", exc_info=True)
+                error("Error in iteration %d: %s", iteration, e, exc_info=True)
             
             # ============================================================
             # Step 6: Sleep until next check
             # ============================================================
-            logger.info(f"💤 Sleeping for {CHECK_INTERVAL}s until next check...")
-            time.sleep(CHECK_INTERVAL)
+            next_deadline += CHECK_INTERVAL
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0:
+                info("💤 Sleeping for %.1fs until next check...", sleep_for)
+                _stop.wait(sleep_for)
+            else:
+                warning("Iteration overran by %.2fs", -sleep_for)
+                next_deadline = time.monotonic()
     
     except KeyboardInterrupt:
-        logger.info("\n" + "=" * 60)
-        logger.info("🛑 Shutdown requested by user")
-        logger.info("=" * 60)
-        
-        # Print final statistics
-        stats = decision_engine.get_scaling_statistics()
-        if stats:
-            logger.info("\nFinal Statistics:")
-            logger.info(f"  Total iterations: {iteration}")
-            logger.info(f"  Total samples:    {stats['total_samples']}")
-            logger.info(f"  Total scaling actions: {len(scaling_history)}")
-            
-            if scaling_history:
-                successful = sum(1 for s in scaling_history if s['success'])
-                logger.info(f"  Successful scalings:   {successful}/{len(scaling_history)}")
-        
-        logger.info("\n✓ Scaler service stopped gracefully")
-        sys.exit(0)
+        reason = "by user"
     
     except Exception as e:
-        logger.critical(f"Fatal error in main loop: {e}", exc_info=True)
+        logger.critical("Fatal error in main loop: %s", e, exc_info=True)
         sys.exit(1)
+    
+    else:
+        reason = "by SIGTERM"
+    
+    io_pool.shutdown(wait=False)
+    ansible_executor.shutdown()
+    prom_client.close()
+    docker_manager.close()
+    logger.info("\n%s", _SEP60)
+    logger.info("🛑 Shutdown requested %s", reason)
+    logger.info(_SEP60)
+    
+    # Print final statistics
+    stats = decision_engine.get_scaling_statistics()
+    if stats:
+        logger.info("\nFinal Statistics:")
+        logger.info("  Total iterations: %d", iteration)
+        logger.info("  Total samples:    %d", stats['total_samples'])
+        history = state.history
+        logger.info("  Total scaling actions: %d", len(history))
+        
+        if history:
+            successful = sum(1 for s in history if s.success)
+            logger.info("  Successful scalings:   %d/%d", successful, len(history))
+            logger.info("  Last scaling action:   %s", _format_ts(history[-1].timestamp))
+    
+    logger.info("\n✓ Scaler service stopped gracefully")
+    sys.exit(0)
 
 
 # ============================================================================